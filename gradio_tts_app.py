@@ -9,9 +9,7 @@ DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 
 
 def set_seed(seed: int):
-    torch.manual_seed(seed)
-    torch.cuda.manual_seed(seed)
-    torch.cuda.manual_seed_all(seed)
+    torch.manual_seed(seed)  # also seeds all CUDA devices
     random.seed(seed)
     np.random.seed(seed)
 
@@ -23,7 +21,7 @@ def load_model():
 
 def generate(model, text, audio_prompt_path, exaggeration, temperature, seed_num, cfgw):
     if model is None:
-        model = ChatterboxTTS.from_pretrained(DEVICE)
+        model = load_model()
 
     if seed_num != 0:
         set_seed(int(seed_num))
@@ -35,7 +33,7 @@ def generate(model, text, audio_prompt_path, exaggeration, temperature, seed_num
         temperature=temperature,
         cfg_weight=cfgw,
     )
-    return (model.sr, wav.squeeze(0).numpy())
+    return (model.sr, wav.squeeze(0).numpy()), model
 
 
 with gr.Blocks() as demo:
@@ -70,7 +68,7 @@ with gr.Blocks() as demo:
             seed_num,
             cfg_weight,
         ],
-        outputs=audio_output,
+        outputs=[audio_output, model_state],
     )
 
 if __name__ == "__main__":
@@ -246,10 +246,17 @@ class T3(nn.Module):
             speech_tokens=initial_speech_tokens,
         )
 
+        # The unconditional CFG row does not contribute to the logits when cfg_weight is 0
+        if cfg_weight == 0:
+            embeds = embeds[:1]
+        cfg_batch_size = embeds.size(0)
+
         # In order to use the standard HF generate method, we need to extend some methods to inject our custom logic
         # Note the llama-specific logic. Other tfmr types can be added later.
 
-        self.compiled = False
+        # NOTE: the backend is built once per model. Each AlignmentStreamAnalyzer adds an attention hook to the
+        # backbone, so rebuilding it per call would stack hooks. Its text slice is therefore the one from the first
+        # call, which is fine while `alignment_stream_analyzer.step` is disabled in the backend.
 
         # TODO? synchronize the expensive compile function
         # with self.compile_lock:
@@ -290,19 +297,24 @@ class T3(nn.Module):
 
         device = embeds.device
 
+        # Look up the speech position embeddings for every decode step at once
+        speech_pos_embeds = self.speech_pos_emb.get_fixed_embedding(
+            torch.arange(max_new_tokens + 1, device=device)
+        )  # shape: (1, max_new_tokens + 1, embed_dim)
+
         bos_token = torch.tensor([[self.hp.start_speech_token]], dtype=torch.long, device=device)
         bos_embed = self.speech_emb(bos_token)  # shape: (B, 1, embed_dim)
-        bos_embed = bos_embed + self.speech_pos_emb.get_fixed_embedding(0)
+        bos_embed = bos_embed + speech_pos_embeds[:, :1]
 
-        # batch_size=2 for CFG
-        bos_embed = torch.cat([bos_embed, bos_embed])
+        # batch_size=2 for CFG, 1 when the unconditional row was dropped
+        bos_embed = bos_embed.expand(cfg_batch_size, -1, -1)
 
         # Combine condition and BOS token for the initial input
         inputs_embeds = torch.cat([embeds, bos_embed], dim=1)
 
-        # Track generated token ids; start with the BOS token.
-        generated_ids = bos_token.clone()
-        predicted = []  # To store the predicted tokens
+        # Track generated token ids in a preallocated buffer; start with the BOS token.
+        generated_ids = bos_token.new_empty((1, max_new_tokens + 1))
+        generated_ids[:, :1] = bos_token
 
         # Instantiate the logits processors.
         top_p_warper = TopPLogitsWarper(top_p=top_p)
@@ -325,25 +337,27 @@ class T3(nn.Module):
             logits = output.logits[:, -1, :]
 
             # CFG
-            logits_cond = logits[0:1]
-            logits_uncond = logits[1:2]
-            logits = logits_cond + cfg_weight * (logits_cond - logits_uncond)
+            if cfg_batch_size > 1:
+                logits_cond = logits[0:1]
+                logits_uncond = logits[1:2]
+                logits = logits_cond + cfg_weight * (logits_cond - logits_uncond)
             logits = logits.squeeze(1)
 
             # Apply temperature scaling.
             if temperature != 1.0:
                 logits = logits / temperature
 
-            # Apply repetition penalty and top‑p filtering.
-            logits = repetition_penalty_processor(generated_ids, logits)
-            logits = top_p_warper(None, logits)
+            # Apply repetition penalty and top‑p filtering, skipping them when they are no-ops.
+            if repetition_penalty != 1.0:
+                logits = repetition_penalty_processor(generated_ids[:, :i + 1], logits)
+            if top_p < 1.0:
+                logits = top_p_warper(None, logits)
 
             # Convert logits to probabilities and sample the next token.
             probs = torch.softmax(logits, dim=-1)
             next_token = torch.multinomial(probs, num_samples=1)  # shape: (B, 1)
 
-            predicted.append(next_token)
-            generated_ids = torch.cat([generated_ids, next_token], dim=1)
+            generated_ids[:, i + 1:i + 2] = next_token
 
             # Check for EOS token.
             if next_token.view(-1) == self.hp.stop_speech_token:
@@ -351,10 +365,10 @@ class T3(nn.Module):
 
             # Get embedding for the new token.
             next_token_embed = self.speech_emb(next_token)
-            next_token_embed = next_token_embed + self.speech_pos_emb.get_fixed_embedding(i + 1)
+            next_token_embed = next_token_embed + speech_pos_embeds[:, i + 1:i + 2]
 
             #  For CFG
-            next_token_embed = torch.cat([next_token_embed, next_token_embed])
+            next_token_embed = next_token_embed.expand(cfg_batch_size, -1, -1)
 
             # Forward pass with only the new token and the cached past.
             output = self.patched_model(
@@ -367,6 +381,6 @@ class T3(nn.Module):
             # Update the kv_cache.
             past = output.past_key_values
 
-        # Concatenate all predicted tokens along the sequence dimension.
-        predicted_tokens = torch.cat(predicted, dim=1)  # shape: (B, num_tokens)
+        # All predicted tokens, excluding the BOS token.
+        predicted_tokens = generated_ids[:, 1:i + 2]  # shape: (B, num_tokens)
         return predicted_tokens
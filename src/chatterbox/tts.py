@@ -1,4 +1,8 @@
+import hashlib
+import os
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import librosa
@@ -18,6 +22,16 @@ from .models.t3.modules.cond_enc import T3Cond
 REPO_ID = "ResembleAI/chatterbox"
 
 
+@lru_cache(maxsize=64)
+def _file_digest(fpath: str, mtime_ns: int, size: int) -> str:
+    """
+        Content digest of a file. The mtime and size are part of the cache
+        key only, so a rewritten file is hashed again.
+    """
+    with open(fpath, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
 def punc_norm(text: str) -> str:
     """
         Quick cleanup func for punctuation from LLMs or
@@ -103,6 +117,7 @@ class Conditionals:
 class ChatterboxTTS:
     ENC_COND_LEN = 6 * S3_SR
     DEC_COND_LEN = 10 * S3GEN_SR
+    CONDS_CACHE_SIZE = 8  # number of reference voices to keep prepared
 
     def __init__(
         self,
@@ -121,6 +136,7 @@ class ChatterboxTTS:
         self.device = device
         self.conds = conds
         self.watermarker = perth.PerthImplicitWatermarker()
+        self._conds_cache = OrderedDict()
 
     @classmethod
     def from_local(cls, ckpt_dir, device) -> 'ChatterboxTTS':
@@ -162,7 +178,35 @@ class ChatterboxTTS:
 
         return cls.from_local(Path(local_path).parent, device)
 
+    def _conds_cache_key(self, wav_fpath):
+        # Only paths are cached; file-like objects (also accepted by librosa.load) are prepared every time
+        if not isinstance(wav_fpath, (str, os.PathLike)):
+            return None
+
+        # Key by content so re-uploads of the same clip under a new path also hit
+        fpath = os.fspath(wav_fpath)
+        stat = os.stat(fpath)
+        return _file_digest(fpath, stat.st_mtime_ns, stat.st_size)
+
+    def _set_exaggeration(self, exaggeration):
+        if exaggeration != self.conds.t3.emotion_adv[0, 0, 0]:
+            _cond: T3Cond = self.conds.t3
+            self.conds.t3 = T3Cond(
+                speaker_emb=_cond.speaker_emb,
+                cond_prompt_speech_tokens=_cond.cond_prompt_speech_tokens,
+                emotion_adv=exaggeration * torch.ones(1, 1, 1),
+            ).to(device=self.device)
+
+    @torch.inference_mode()
     def prepare_conditionals(self, wav_fpath, exaggeration=0.5):
+        # Reuse the conditionals of a recently prepared reference wav
+        cache_key = self._conds_cache_key(wav_fpath)
+        if cache_key is not None and (conds := self._conds_cache.get(cache_key)) is not None:
+            self._conds_cache.move_to_end(cache_key)
+            self.conds = conds
+            self._set_exaggeration(exaggeration)
+            return
+
         ## Load reference wav
         s3gen_ref_wav, _sr = librosa.load(wav_fpath, sr=S3GEN_SR)
 
@@ -188,6 +232,11 @@ class ChatterboxTTS:
         ).to(device=self.device)
         self.conds = Conditionals(t3_cond, s3gen_ref_dict)
 
+        if cache_key is not None:
+            self._conds_cache[cache_key] = self.conds
+            if len(self._conds_cache) > self.CONDS_CACHE_SIZE:
+                self._conds_cache.popitem(last=False)
+
     def generate(
         self,
         text,
@@ -202,13 +251,7 @@ class ChatterboxTTS:
             assert self.conds is not None, "Please `prepare_conditionals` first or specify `audio_prompt_path`"
 
         # Update exaggeration if needed
-        if exaggeration != self.conds.t3.emotion_adv[0, 0, 0]:
-            _cond: T3Cond = self.conds.t3
-            self.conds.t3 = T3Cond(
-                speaker_emb=_cond.speaker_emb,
-                cond_prompt_speech_tokens=_cond.cond_prompt_speech_tokens,
-                emotion_adv=exaggeration * torch.ones(1, 1, 1),
-            ).to(device=self.device)
+        self._set_exaggeration(exaggeration)
 
         # Norm and tokenize text
         text = punc_norm(text)
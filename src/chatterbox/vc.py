@@ -57,6 +57,7 @@ class ChatterboxVC:
 
         return cls.from_local(Path(local_path).parent, device)
 
+    @torch.inference_mode()
     def set_target_voice(self, wav_fpath):
         ## Load reference wav
         s3gen_ref_wav, _sr = librosa.load(wav_fpath, sr=S3GEN_SR)